@@ -2,18 +2,28 @@
 Methods to interact with the Asgard API to perform various tasks.
 """
 
-from datetime import datetime, timedelta
 import os
+import json
 import logging
+import threading
 import time
 import copy
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import backoff
 import requests
 import six
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from botocore.exceptions import ClientError
 import tubular.ec2 as ec2
 
+try:
+    # Optional - used to stream-parse the large cluster list response.
+    import ijson
+except ImportError:
+    ijson = None
+
 from tubular.exception import (
     ASGCountZeroException,
     ASGDoesNotExistException,
@@ -34,11 +44,15 @@ from tubular.exception import (
 from tubular.utils import WAIT_SLEEP_TIME, DISABLE_OLD_ASG_WAIT_TIME
 
 ASGARD_API_ENDPOINT = os.environ.get("ASGARD_API_ENDPOINTS", "http://dummy.url:8091/us-east-1")
-ASGARD_API_TOKEN = "asgardApiToken={}".format(os.environ.get("ASGARD_API_TOKEN", "dummy-token"))
+ASGARD_API_TOKEN = {"asgardApiToken": os.environ.get("ASGARD_API_TOKEN", "dummy-token")}
 # Asgard's ASG creation times out at 25 minutes - set tubular's timeout to 26 minutes (1560 seconds).
 ASGARD_NEW_ASG_CREATION_TIMEOUT = int(os.environ.get("ASGARD_NEW_ASG_CREATION_TIMEOUT", 1560))
 ASGARD_ELB_HEALTH_TIMEOUT = int(os.environ.get("ASGARD_ELB_HEALTH_TIMEOUT", 900))
 REQUESTS_TIMEOUT = float(os.environ.get("REQUESTS_TIMEOUT", 10))
+# Upper bound on concurrent Asgard operations during a deploy. The shared session's
+# connection pool is sized to match so workers never queue on a socket.
+ASGARD_MAX_CONCURRENCY = int(os.environ.get("ASGARD_MAX_CONCURRENCY", 8))
+CLUSTER_LIST_CACHE_TTL = float(os.environ.get("CLUSTER_LIST_CACHE_TTL", 10))
 
 CLUSTER_LIST_URL = "{}/cluster/list.json".format(ASGARD_API_ENDPOINT)
 ASG_ACTIVATE_URL = "{}/cluster/activate".format(ASGARD_API_ENDPOINT)
@@ -48,10 +62,180 @@ NEW_ASG_URL = "{}/cluster/createNextGroup".format(ASGARD_API_ENDPOINT)
 ASG_INFO_URL = "{}/autoScaling/show/{}.json".format(ASGARD_API_ENDPOINT, "{}")
 CLUSTER_INFO_URL = "{}/cluster/show/{}.json".format(ASGARD_API_ENDPOINT, "{}")
 
+# Pre-bound formatters for the per-resource URLs built on every call, so hot
+# call sites skip the template attribute lookup each time.
+_format_asg_info_url = ASG_INFO_URL.format
+_format_cluster_info_url = CLUSTER_INFO_URL.format
+
 LOG = logging.getLogger(__name__)
 
 MAX_ATTEMPTS = int(os.environ.get('RETRY_MAX_ATTEMPTS', 5))
 
+# A single session is shared by all Asgard calls so that the TCP connection (and TLS
+# handshake) is reused across the many serial requests a deploy makes against one host.
+_SESSION = requests.Session()
+_SESSION.params = ASGARD_API_TOKEN
+_SESSION.headers.update({"Accept": "application/json"})
+_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=max(20, ASGARD_MAX_CONCURRENCY),
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+
+class _SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    still in flight wait on the same Future and share its result. Nothing is
+    cached - once a call finishes, the next caller starts a fresh one.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key, func):
+        """
+        Run func (or wait on an identical in-flight call) and return its result.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                owner = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+
+# Deduplicates identical requests made at the same moment by deploy worker threads.
+_SINGLE_FLIGHT = _SingleFlight()
+
+# The cluster list is large and changes rarely - cache it briefly so the several
+# calls a single deploy makes share one HTTP round-trip.
+_CLUSTER_LIST_CACHE = {"expires": 0.0, "json": None}
+
+
+def _fetch_cluster_list():
+    """
+    Fetch the full Asgard cluster list, caching it for CLUSTER_LIST_CACHE_TTL seconds.
+
+    Returns:
+        list(dict): Parsed json of all Asgard clusters.
+
+    Raises:
+        BackendError: When a non-JSON response is returned from Asgard.
+        RateLimitedException: When we are being rate limited by AWS.
+    """
+    now = time.monotonic()
+    if _CLUSTER_LIST_CACHE["json"] is not None and now < _CLUSTER_LIST_CACHE["expires"]:
+        return _CLUSTER_LIST_CACHE["json"]
+
+    def _fetch():
+        """
+        Fetch and parse the cluster list over HTTP.
+        """
+        LOG.debug("Getting Cluster List from: %s", CLUSTER_LIST_URL)
+        response = _SESSION.get(CLUSTER_LIST_URL, timeout=REQUESTS_TIMEOUT, stream=True)
+        return _parse_cluster_list_response(CLUSTER_LIST_URL, response)
+
+    # Concurrent workers that miss the cache at the same moment share one fetch.
+    cluster_json = _SINGLE_FLIGHT.do(CLUSTER_LIST_URL, _fetch)
+
+    _CLUSTER_LIST_CACHE["json"] = cluster_json
+    _CLUSTER_LIST_CACHE["expires"] = now + CLUSTER_LIST_CACHE_TTL
+    return cluster_json
+
+
+class _PrefixedStream:
+    """
+    File-like object that replays an already-read prefix before the rest of a stream.
+    """
+    def __init__(self, prefix, stream):
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, size=-1):
+        """
+        Return the prefix first, then delegate to the underlying stream.
+        """
+        if size == 0:
+            return b""
+        if self._prefix:
+            prefix = self._prefix
+            self._prefix = b""
+            return prefix
+        return self._stream.read(size)
+
+
+def _parse_cluster_list_response(url, response):
+    """
+    Parse a cluster list response, streaming clusters out of the body with ijson
+    when it is installed rather than materializing the full JSON text first.
+
+    Falls back to the regular parser when ijson is unavailable or the body is not
+    the expected JSON array (e.g. a throttling error object or an HTML error page).
+    """
+    if ijson is None:
+        return _parse_asgard_json_response(url, response)
+
+    # Let urllib3 decompress the body as it is read.
+    response.raw.decode_content = True
+    stream = response.raw
+    first = stream.read(1)
+    while first and first.isspace():
+        first = stream.read(1)
+
+    if first != b"[":
+        # Not a cluster array - buffer the body and run the strict parser so
+        # throttling errors and bad responses surface exactly as before.
+        body = first + stream.read()
+        try:
+            parsed = json.loads(body)
+        except ValueError:
+            msg = "Expected json response from url: '{}' - but got the following:\n{}"
+            raise BackendError(msg.format(url, body.decode("utf-8", "replace")))
+        _handle_throttling(parsed)
+        return parsed
+
+    try:
+        return list(ijson.items(_PrefixedStream(first, stream), "item"))
+    except ijson.JSONError:
+        msg = "Expected json response from url: '{}' - but could not parse the response body."
+        raise BackendError(msg.format(url))
+
+
+def _invalidate_cluster_list_cache():
+    """
+    Drop the cached cluster list, forcing the next fetch to hit Asgard.
+    """
+    _CLUSTER_LIST_CACHE["json"] = None
+
+
+def _concurrency(work_items):
+    """
+    Number of worker threads to use for a batch of per-cluster operations.
+    """
+    return min(ASGARD_MAX_CONCURRENCY, max(1, len(work_items)))
+
 
 def _handle_throttling(json_response):
     """
@@ -121,11 +305,11 @@ def clusters_for_asgs(asgs):
         RateLimitedException: When we are being rate limited by AWS.
     """
 
-    request = requests.Request('GET', CLUSTER_LIST_URL, params=ASGARD_API_TOKEN)
-    url = request.prepare().url
-    LOG.debug("Getting Cluster List from: {}".format(url))
-    response = requests.get(CLUSTER_LIST_URL, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
-    cluster_json = _parse_asgard_json_response(url, response)
+    cluster_json = _fetch_cluster_list()
+
+    # Hash lookups keep the membership scan O(1) per ASG instead of rescanning
+    # the requested list for every ASG of every cluster.
+    remaining = set(asgs)
 
     relevant_clusters = {}
     for cluster in cluster_json:
@@ -133,13 +317,14 @@ def clusters_for_asgs(asgs):
             msg = "Expected 'cluster' and 'autoScalingGroups' keys in dict: {}".format(cluster)
             raise BackendDataError(msg)
 
-        for asg in cluster['autoScalingGroups']:
-            LOG.debug("Membership: {} in {}: {}".format(asg, asgs, asg in asgs))
-            if asg in asgs:
-                relevant_clusters[cluster['cluster']] = cluster['autoScalingGroups']
-                # A cluster can have multiple relevant ASGs.
-                # We don't need to check them all.
-                break  # The inner for loop
+        # A cluster is relevant if any of its ASGs is one we care about.
+        matched = remaining.intersection(cluster['autoScalingGroups'])
+        if matched:
+            relevant_clusters[cluster['cluster']] = cluster['autoScalingGroups']
+            remaining -= matched
+            # All requested ASGs are mapped - no point scanning the rest.
+            if not remaining:
+                break
 
     return relevant_clusters
 
@@ -162,10 +347,10 @@ def asgs_for_cluster(cluster):
         RateLimitedException: When we are being rate limited by AWS.
     """
 
-    LOG.debug("URL: {}".format(CLUSTER_INFO_URL.format(cluster)))
-    url = CLUSTER_INFO_URL.format(cluster)
-    response = requests.get(url, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
-    LOG.debug("ASGs for Cluster: {}".format(response.text))
+    url = _format_cluster_info_url(cluster)
+    LOG.debug("URL: %s", url)
+    response = _SESSION.get(url, timeout=REQUESTS_TIMEOUT)
+    LOG.debug("ASGs for Cluster: %s", response.text)
     asgs_json = _parse_asgard_json_response(url, response)
 
     if len(asgs_json) < 1:
@@ -197,15 +382,31 @@ def wait_for_task_completion(task_url, timeout):
     if not task_url.endswith('.json'):
         task_url += ".json"
 
-    LOG.debug("Task URL: {}".format(task_url))
-    end_time = datetime.utcnow() + timedelta(seconds=timeout)
-    while end_time > datetime.utcnow():
-        response = requests.get(task_url, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
+    LOG.debug("Task URL: %s", task_url)
+    end_time = time.monotonic() + timeout
+    # Poll with exponential backoff (capped at WAIT_SLEEP_TIME) so short tasks
+    # return quickly while long-running tasks don't hammer Asgard once a second.
+    delay = 0.25
+    previous_progress = None
+    while time.monotonic() < end_time:
+        # Workers polling the same task share one in-flight GET.
+        response = _SINGLE_FLIGHT.do(
+            task_url,
+            lambda: _SESSION.get(task_url, timeout=REQUESTS_TIMEOUT)
+        )
         json_response = _parse_asgard_json_response(task_url, response)
         if json_response['status'] in ('completed', 'failed'):
             return json_response
 
-        time.sleep(WAIT_SLEEP_TIME)
+        # If the task has made no visible progress since the last poll, back off
+        # early - the next status change is unlikely to be imminent.
+        progress = (json_response['status'], len(json_response.get('log', [])))
+        if progress == previous_progress:
+            delay = min(delay * 2, WAIT_SLEEP_TIME)
+        previous_progress = progress
+
+        time.sleep(delay)
+        delay = min(delay * 2, WAIT_SLEEP_TIME)
 
     raise TimeoutException("Timed out while waiting for task {}".format(task_url))
 
@@ -238,11 +439,11 @@ def new_asg(cluster, ami_id):
         "imageId": ami_id,
     }
 
-    response = requests.post(
+    response = _SESSION.post(
         NEW_ASG_URL,
-        data=payload, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT
+        data=payload, timeout=REQUESTS_TIMEOUT
     )
-    LOG.debug("Sent request to create new ASG in Cluster({}).".format(cluster))
+    LOG.debug("Sent request to create new ASG in Cluster(%s).", cluster)
 
     if response.status_code == 404:
         msg = "Can't create more ASGs for cluster {}. Please either wait " \
@@ -261,11 +462,14 @@ def new_asg(cluster, ami_id):
             raise JavaSocketException(msg)
         raise BackendError(msg)
 
+    # Cluster membership just changed - don't serve the stale cluster list.
+    _invalidate_cluster_list_cache()
+
     # Potential Race condition if multiple people are making ASGs for the same cluster
     # Return the name of the newest asg
     asgs = asgs_for_cluster(cluster)
     newest_asg = asgs[-1]
-    LOG.debug("New ASG({}) created in cluster({}).".format(newest_asg['autoScalingGroupName'], cluster))
+    LOG.debug("New ASG(%s) created in cluster(%s).", newest_asg['autoScalingGroupName'], cluster)
 
     if _asg_is_empty(newest_asg):
         # ISRE-618 - Cleanup empty ASGs, throw error to backoff, and start again.
@@ -329,8 +533,8 @@ def _get_asgard_resource_info(url):
         RateLimitedException: When we are being rate limited by AWS.
     """
 
-    LOG.debug("URL: {}".format(url))
-    response = requests.get(url, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
+    LOG.debug("URL: %s", url)
+    response = _SESSION.get(url, timeout=REQUESTS_TIMEOUT)
 
     if response.status_code == 404:
         raise ResourceDoesNotExistException('Resource for url {} does not exist'.format(url))
@@ -339,7 +543,7 @@ def _get_asgard_resource_info(url):
     if response.status_code != 200:
         raise BackendError('Call to asgard failed with status code: {0}: {1}'
                            .format(response.status_code, response.text))
-    LOG.debug("ASG info: {}".format(response.text))
+    LOG.debug("ASG info: %s", response.text)
     resource_info_json = _parse_asgard_json_response(url, response)
     return resource_info_json
 
@@ -359,7 +563,7 @@ def get_asg_info(asg):
         BackendError: When a non 200 response code is returned from the Asgard API
         ASGDoesNotExistException: When an ASG does not exist
     """
-    url = ASG_INFO_URL.format(asg)
+    url = _format_asg_info_url(asg)
     try:
         info = _get_asgard_resource_info(url)
     except ResourceDoesNotExistException:
@@ -383,7 +587,7 @@ def get_cluster_info(cluster):
         BackendError: When a non 200 response code is returned from the Asgard API
         ClusterDoesNotExistException: When an ASG does not exist
     """
-    url = CLUSTER_INFO_URL.format(cluster)
+    url = _format_cluster_info_url(cluster)
     try:
         info = _get_asgard_resource_info(url)
     except ResourceDoesNotExistException:
@@ -481,9 +685,9 @@ def enable_asg(asg):
         RateLimitedException: When we are being rate limited by AWS.
     """
     payload = {"name": asg}
-    response = requests.post(
+    response = _SESSION.post(
         ASG_ACTIVATE_URL,
-        data=payload, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT
+        data=payload, timeout=REQUESTS_TIMEOUT
     )
     task_url = response.url
     task_status = wait_for_task_completion(task_url, 301)
@@ -517,10 +721,10 @@ def disable_asg(asg):
     """
     try:
         if is_asg_pending_delete(asg):
-            LOG.info("Not disabling old ASG {} due to its pending deletion.".format(asg))
+            LOG.info("Not disabling old ASG %s due to its pending deletion.", asg)
             return
     except ASGDoesNotExistException:
-        LOG.info("Not disabling ASG {}, it no longer exists.".format(asg))
+        LOG.info("Not disabling ASG %s, it no longer exists.", asg)
         return
 
     if is_last_asg(asg):
@@ -528,9 +732,9 @@ def disable_asg(asg):
         raise CannotDisableActiveASG(msg)
 
     payload = {"name": asg}
-    response = requests.post(
+    response = _SESSION.post(
         ASG_DEACTIVATE_URL,
-        data=payload, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT
+        data=payload, timeout=REQUESTS_TIMEOUT
     )
     task_url = response.url
     task_status = wait_for_task_completion(task_url, 300)
@@ -562,7 +766,7 @@ def delete_asg(asg, fail_if_active=True, fail_if_last=True, wait_for_deletion=Tr
         RateLimitedException: When we are being rate limited by AWS.
     """
     if is_asg_pending_delete(asg):
-        LOG.info("Not deleting ASG {} due to its already pending deletion.".format(asg))
+        LOG.info("Not deleting ASG %s due to its already pending deletion.", asg)
         return
     if fail_if_active and is_asg_enabled(asg):
         msg = "Not deleting ASG {} as it is currently active.".format(asg)
@@ -571,9 +775,8 @@ def delete_asg(asg, fail_if_active=True, fail_if_last=True, wait_for_deletion=Tr
             ec2.remove_asg_deletion_tag(asg)
         except ClientError as tagging_error:
             LOG.warning(
-                "Failed to remove deletion tag from asg {}. Ignoring: {}".format(
-                    asg, tagging_error.response.get('Error', {}).get('Message')
-                )
+                "Failed to remove deletion tag from asg %s. Ignoring: %s",
+                asg, tagging_error.response.get('Error', {}).get('Message')
             )
         raise CannotDeleteActiveASG(msg)
 
@@ -584,15 +787,14 @@ def delete_asg(asg, fail_if_active=True, fail_if_last=True, wait_for_deletion=Tr
             ec2.remove_asg_deletion_tag(asg)
         except ClientError as tagging_error:
             LOG.warning(
-                "Failed to remove deletion tag from asg {}. Ignoring: {}".format(
-                    asg, tagging_error.response.get('Error', {}).get('Message')
-                )
+                "Failed to remove deletion tag from asg %s. Ignoring: %s",
+                asg, tagging_error.response.get('Error', {}).get('Message')
             )
         raise CannotDeleteLastASG(msg)
 
     payload = {"name": asg}
-    response = requests.post(ASG_DELETE_URL,
-                             data=payload, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
+    response = _SESSION.post(ASG_DELETE_URL,
+                             data=payload, timeout=REQUESTS_TIMEOUT)
     task_url = response.url
     if wait_for_deletion:
         task_status = wait_for_task_completion(task_url, 300)
@@ -619,8 +821,8 @@ def elbs_for_asg(asg):
         BackendDataError: If unexpected response from Asgard.
         RateLimitedException: When we are being rate limited by AWS.
     """
-    url = ASG_INFO_URL.format(asg)
-    response = requests.get(url, params=ASGARD_API_TOKEN, timeout=REQUESTS_TIMEOUT)
+    url = _format_asg_info_url(asg)
+    response = _SESSION.get(url, timeout=REQUESTS_TIMEOUT)
     resp_json = _parse_asgard_json_response(url, response)
     try:
         elbs = resp_json['group']['loadBalancerNames']
@@ -667,11 +869,11 @@ def rollback(current_clustered_asgs, rollback_to_clustered_asgs, ami_id=None):
                     ec2.remove_asg_deletion_tag(asg)
                 if is_asg_pending_delete(asg):
                     # Too late for rollback - this ASG is already pending delete.
-                    LOG.info("Rollback ASG '{}' is pending delete. Aborting rollback to ASGs.".format(asg))
+                    LOG.info("Rollback ASG '%s' is pending delete. Aborting rollback to ASGs.", asg)
                     rollback_ready = False
                     break
             except ASGDoesNotExistException:
-                LOG.info("Rollback ASG '{}' has been removed. Aborting rollback to ASGs.".format(asg))
+                LOG.info("Rollback ASG '%s' has been removed. Aborting rollback to ASGs.", asg)
                 rollback_ready = False
                 break
     disabled_ami_id = None
@@ -689,7 +891,7 @@ def rollback(current_clustered_asgs, rollback_to_clustered_asgs, ami_id=None):
         # Perform the rollback.
         success, enabled_asgs, disabled_asgs = _red_black_deploy(rollback_to_clustered_asgs, current_clustered_asgs)
         if not success:
-            LOG.info("Rollback failed for cluster(s) {}.".format(current_clustered_asgs.keys()))
+            LOG.info("Rollback failed for cluster(s) %s.", current_clustered_asgs.keys())
         else:
             LOG.info("Woot! Rollback Done!")
             return {
@@ -702,7 +904,7 @@ def rollback(current_clustered_asgs, rollback_to_clustered_asgs, ami_id=None):
 
     # Rollback failed -or- wasn't attempted. Attempt a deploy.
     if ami_id:
-        LOG.info("Attempting rollback via deploy of AMI {}.".format(ami_id))
+        LOG.info("Attempting rollback via deploy of AMI %s.", ami_id)
         return deploy(ami_id)
     else:
         LOG.info("No AMI id specified - so no deploy occurred during rollback.")
@@ -735,7 +937,7 @@ def deploy(ami_id):
         BackendError: When the task to bring up the new instance fails.
         ASGDoesNotExistException: If the ASG being queried does not exist.
     """
-    LOG.info("Processing request to deploy {}.".format(ami_id))
+    LOG.info("Processing request to deploy %s.", ami_id)
 
     # Pull the EDP from the AMI ID
     edp = ec2.edp_for_ami(ami_id)
@@ -753,32 +955,44 @@ def deploy(ami_id):
 
     # Find the clusters for all the existing ASGs.
     existing_clustered_asgs = clusters_for_asgs(existing_edp_asgs)
-    LOG.info("Deploying to cluster(s) {}".format(existing_clustered_asgs.keys()))
+    LOG.info("Deploying to cluster(s) %s", existing_clustered_asgs.keys())
 
-    # Create a new ASG in each cluster.
+    # Create a new ASG in each cluster. Each creation blocks on an Asgard task,
+    # and the clusters are independent, so run them concurrently - the wall-clock
+    # cost becomes the slowest cluster instead of the sum of all of them.
     new_clustered_asgs = defaultdict(list)
-    for cluster in existing_clustered_asgs:
+    with ThreadPoolExecutor(max_workers=_concurrency(existing_clustered_asgs)) as executor:
+        future_to_cluster = {
+            executor.submit(new_asg, cluster, ami_id): cluster
+            for cluster in existing_clustered_asgs
+        }
         try:
-            newest_asg = new_asg(cluster, ami_id)
-            new_clustered_asgs[cluster].append(newest_asg)
-        except:
-            msg = "ASG creation failed for cluster '{}' but succeeded for cluster(s) {}."
-            msg = msg.format(cluster, new_clustered_asgs.keys())
-            LOG.exception(msg)
-            raise
+            for future in as_completed(future_to_cluster):
+                cluster = future_to_cluster[future]
+                try:
+                    new_clustered_asgs[cluster].append(future.result())
+                except:
+                    msg = "ASG creation failed for cluster '{}' but succeeded for cluster(s) {}."
+                    msg = msg.format(cluster, new_clustered_asgs.keys())
+                    LOG.exception(msg)
+                    raise
+        finally:
+            # Don't start creations for clusters still queued once one has failed.
+            for outstanding in future_to_cluster:
+                outstanding.cancel()
 
     new_asgs = [asgs[0] for asgs in new_clustered_asgs.values()]
-    LOG.info("New ASGs created: {}".format(new_asgs))
+    LOG.info("New ASGs created: %s", new_asgs)
     ec2.wait_for_in_service(new_asgs, 300)
-    LOG.info("New ASGs healthy: {}".format(new_asgs))
+    LOG.info("New ASGs healthy: %s", new_asgs)
 
-    LOG.info("Enabling traffic to new ASGs for the {} cluster(s).".format(existing_clustered_asgs.keys()))
+    LOG.info("Enabling traffic to new ASGs for the %s cluster(s).", existing_clustered_asgs.keys())
     success, enabled_asgs, disabled_asgs = _red_black_deploy(dict(new_clustered_asgs), existing_clustered_asgs)
     if not success:
         raise BackendError("Error performing red/black deploy - deploy was unsuccessful. "
                            "enabled_asgs: {} - disabled_asgs: {}".format(enabled_asgs, disabled_asgs))
-    LOG.info("Enabled the following ASGs: {}".format(enabled_asgs))
-    LOG.info("Disabled the following ASGs: {}".format(disabled_asgs))
+    LOG.info("Enabled the following ASGs: %s", enabled_asgs)
+    LOG.info("Disabled the following ASGs: %s", disabled_asgs)
     LOG.info("Woot! Deploy Done!")
     return {
         'ami_id': ami_id,
@@ -856,17 +1070,31 @@ def _red_black_deploy(  # pylint: disable=too-many-statements
     def _disable_clustered_asgs(clustered_asgs, failure_msg):
         """
         Disable all the ASGs in the lists, keyed by cluster.
+
+        Clusters are disabled concurrently. ASGs within a cluster are handled in
+        order so the enabled/disabled bookkeeping lists stay deterministic.
         """
-        for cluster, asgs in six.iteritems(clustered_asgs):
+        def _disable_asgs_for_cluster(cluster, asgs):
+            """
+            Disable the ASGs of a single cluster, one at a time.
+            """
             for asg in asgs:
                 try:
                     _disable_cluster_asg(cluster, asg)
                 except:  # pylint: disable=bare-except
                     LOG.warning(failure_msg, asg, exc_info=True)
 
+        with ThreadPoolExecutor(max_workers=_concurrency(clustered_asgs)) as executor:
+            for cluster, asgs in six.iteritems(clustered_asgs):
+                executor.submit(_disable_asgs_for_cluster, cluster, list(asgs))
+
     elbs_to_monitor = []
     newly_enabled_asgs = defaultdict(list)
-    for cluster, asgs in six.iteritems(new_cluster_asgs):
+
+    def _enable_asgs_for_cluster(cluster, asgs):
+        """
+        Enable each new ASG of a single cluster and record the ELBs routing to it.
+        """
         for asg in asgs:
             try:
                 _enable_cluster_asg(cluster, asg)
@@ -876,16 +1104,33 @@ def _red_black_deploy(  # pylint: disable=too-many-statements
                 LOG.error("Error enabling ASG '%s'. Disabling traffic to all new ASGs.", asg, exc_info=True)
                 # Disable the ASG which failed first.
                 _disable_cluster_asg(cluster, asg)
-                # Then disable any new other ASGs that have been newly enabled.
-                _disable_clustered_asgs(
-                    newly_enabled_asgs,
-                    "Unable to disable ASG '%s' after failure."
-                )
-                return (False, asgs_enabled, asgs_disabled)
+                raise
+
+    # Enable the new ASGs cluster-by-cluster in parallel - each enablement waits
+    # on an Asgard task, so clusters shouldn't queue up behind each other.
+    enable_failed = False
+    with ThreadPoolExecutor(max_workers=_concurrency(new_cluster_asgs)) as executor:
+        enable_futures = [
+            executor.submit(_enable_asgs_for_cluster, cluster, asgs)
+            for cluster, asgs in six.iteritems(new_cluster_asgs)
+        ]
+        for future in enable_futures:
+            try:
+                future.result()
+            except:  # pylint: disable=bare-except
+                enable_failed = True
+    if enable_failed:
+        # Disable any new ASGs that have been newly enabled.
+        _disable_clustered_asgs(
+            newly_enabled_asgs,
+            "Unable to disable ASG '%s' after failure."
+        )
+        return (False, asgs_enabled, asgs_disabled)
 
-    LOG.info("New ASGs {} are active and will be available after passing the healthchecks.".format(
+    LOG.info(
+        "New ASGs %s are active and will be available after passing the healthchecks.",
         dict(newly_enabled_asgs)
-    ))
+    )
 
     # Wait for all instances to be in service in all ELBs.
     try:
@@ -912,17 +1157,20 @@ def _red_black_deploy(  # pylint: disable=too-many-statements
             elif not is_asg_enabled(asg):
                 err_msg = "New ASG '{}' is not enabled.".format(asg)
             if err_msg:
-                LOG.error("{} Aborting disabling of old ASGs.".format(err_msg))
+                LOG.error("%s Aborting disabling of old ASGs.", err_msg)
                 return (False, asgs_enabled, asgs_disabled)
 
     LOG.info("New ASGs have passed the healthchecks. Now disabling old ASGs.")
 
-    for cluster, asgs in six.iteritems(baseline_cluster_asgs):
+    def _disable_baseline_asgs_for_cluster(cluster, asgs):
+        """
+        Disable and tag the baseline ASGs of a single cluster, in order.
+        """
         for asg in asgs:
             # Dont disable an ASG if it was just enabled. You can get an ASG name in both "baseline" and "newly_enabled" asgs
             # if an ASG was empty and we deleted earlier in the deploy logic.
             if asg in newly_enabled_asgs[cluster]:
-                LOG.info("Found that asg {} was just enabled, skipping disable step for it.".format(asg))
+                LOG.info("Found that asg %s was just enabled, skipping disable step for it.", asg)
                 continue
             try:
                 if is_asg_enabled(asg):
@@ -937,13 +1185,21 @@ def _red_black_deploy(  # pylint: disable=too-many-statements
                     _move_asg_from_enabled_to_disabled(cluster, asg)
             except ASGDoesNotExistException:
                 # This operation should not fail if one of the baseline ASGs was removed during the deployment process
-                LOG.info("ASG {asg} in cluster {cluster} no longer exists, removing it from the enabled cluster list"
-                         .format(asg=asg, cluster=cluster))
+                LOG.info("ASG %s in cluster %s no longer exists, removing it from the enabled cluster list",
+                         asg, cluster)
                 _move_asg_from_enabled_to_disabled(cluster, asg)
 
             try:
                 ec2.tag_asg_for_deletion(asg)
             except ASGDoesNotExistException:
-                LOG.info("Unable to tag ASG '{}' as it no longer exists, skipping.".format(asg))
+                LOG.info("Unable to tag ASG '%s' as it no longer exists, skipping.", asg)
+
+    with ThreadPoolExecutor(max_workers=_concurrency(baseline_cluster_asgs)) as executor:
+        disable_futures = [
+            executor.submit(_disable_baseline_asgs_for_cluster, cluster, asgs)
+            for cluster, asgs in six.iteritems(baseline_cluster_asgs)
+        ]
+        for future in disable_futures:
+            future.result()
 
     return (True, asgs_enabled, asgs_disabled)
@@ -2,6 +2,11 @@
 edX API classes which call edX service REST API endpoints using the edx-rest-api-client module.
 """
 import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 import backoff
@@ -11,7 +16,9 @@ from edx_rest_api_client.client import (
     REQUEST_CONNECT_TIMEOUT,
     REQUEST_READ_TIMEOUT
 )
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, Timeout
+from urllib3.util.retry import Retry
 
 from tubular.exception import HttpDoesNotExistException
 
@@ -19,6 +26,25 @@ LOG = logging.getLogger(__name__)
 
 OAUTH_ACCESS_TOKEN_URL = "/oauth2/access_token"
 
+# Shared session so all API clients reuse pooled keep-alive connections and
+# retry transient server errors at the transport layer. raise_on_status is off
+# so an exhausted retry still surfaces as the usual HTTPError from
+# raise_for_status rather than a urllib3 RetryError.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=4,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST']),
+        raise_on_status=False,
+    ),
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
 
 class EdxGatewayTimeoutError(Exception):
     """
@@ -34,6 +60,10 @@ class BaseApiClient:
     append_slash = True
     _access_token = None
 
+    # OAuth tokens shared across instances, keyed by (oauth_base_url, client_id),
+    # so constructing another client doesn't redo the OAuth round-trip.
+    _TOKEN_CACHE = {}
+
     def __init__(self, lms_base_url, api_base_url, client_id, client_secret):
         """
         Retrieves OAuth access token from the LMS and creates REST API client instance.
@@ -59,7 +89,7 @@ class BaseApiClient:
             kwargs['headers'] = {'Content-type': 'application/json'}
 
         try:
-            response = requests.request(method, url, auth=SuppliedJwtAuth(self._access_token), **kwargs)
+            response = _SESSION.request(method, url, auth=SuppliedJwtAuth(self._access_token), **kwargs)
             response.raise_for_status()
 
             if response.status_code != 204:
@@ -87,14 +117,22 @@ class BaseApiClient:
 
         return response
 
-    @staticmethod
-    def get_access_token(oauth_base_url, client_id, client_secret):
+    @classmethod
+    def get_access_token(cls, oauth_base_url, client_id, client_secret):
         """
         Returns an access token for this site's service user.
 
+        Tokens are cached until shortly before expiry, so repeated client
+        construction reuses one OAuth round-trip.
+
         Returns:
             str: JWT access token
         """
+        cache_key = (oauth_base_url, client_id)
+        cached = cls._TOKEN_CACHE.get(cache_key)
+        if cached and cached[1] - time.time() > 60:
+            return cached[0]
+
         oauth_access_token_url = urljoin(f'{oauth_base_url}/', OAUTH_ACCESS_TOKEN_URL)
         data = {
             'grant_type': 'client_credentials',
@@ -103,7 +141,7 @@ class BaseApiClient:
             'token_type': 'jwt',
         }
         try:
-            response = requests.post(
+            response = _SESSION.post(
                 oauth_access_token_url,
                 data=data,
                 headers={
@@ -112,7 +150,10 @@ class BaseApiClient:
                 timeout=(REQUEST_CONNECT_TIMEOUT, REQUEST_READ_TIMEOUT)
             )
             response.raise_for_status()
-            return response.json()['access_token']
+            payload = response.json()
+            access_token = payload['access_token']
+            cls._TOKEN_CACHE[cache_key] = (access_token, time.time() + payload.get('expires_in', 0))
+            return access_token
         except KeyError as exc:
             LOG.error(f'Failed to get token. {str(exc)} does not exist.')
             raise
@@ -185,14 +226,100 @@ def _retry_lms_api():
     return inner
 
 
+class PaginatedResponse:
+    """
+    Iterates over the items of a paginated endpoint, prefetching upcoming pages.
+
+    Pages after the first are fetched by a background executor while the caller
+    consumes earlier items. A bounded queue holds at most two fetched pages
+    ahead of the consumer, so memory stays bounded regardless of queue depth.
+    """
+    _DONE = object()
+
+    def __init__(self, fetch_page, page_size, max_concurrency):
+        """
+        Args:
+            fetch_page (callable): Takes a 1-based page number, returns that page's items.
+            page_size (int): Items requested per page; a short page ends iteration.
+            max_concurrency (int): Maximum page fetches in flight at once.
+        """
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._max_concurrency = max_concurrency
+
+    def all(self):
+        """
+        Returns every item across all pages as a single list.
+        """
+        return list(self)
+
+    def __iter__(self):
+        pages = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def _put(entry):
+            # Bounded put that gives up once the consumer has gone away.
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def _produce(executor):
+            try:
+                in_flight = OrderedDict()
+                next_page = 1
+                last_page_seen = False
+                while not stop.is_set() and (in_flight or not last_page_seen):
+                    while not last_page_seen and len(in_flight) < self._max_concurrency:
+                        in_flight[next_page] = executor.submit(self._fetch_page, next_page)
+                        next_page += 1
+                    _, future = in_flight.popitem(last=False)
+                    items = future.result()
+                    if len(items) < self._page_size:
+                        # Short page means the queue is drained; drop speculative fetches.
+                        last_page_seen = True
+                        for pending in in_flight.values():
+                            pending.cancel()
+                        in_flight.clear()
+                    if items:
+                        _put(items)
+            except Exception as exc:  # pylint: disable=broad-except
+                _put(exc)
+            else:
+                _put(self._DONE)
+
+        executor = ThreadPoolExecutor(max_workers=self._max_concurrency)
+        producer = threading.Thread(target=_produce, args=(executor,), daemon=True)
+        producer.start()
+        try:
+            while True:
+                entry = pages.get()
+                if entry is self._DONE:
+                    break
+                if isinstance(entry, Exception):
+                    raise entry
+                yield from entry
+        finally:
+            stop.set()
+            producer.join()
+            executor.shutdown(wait=False)
+
+
 class LmsApi(BaseApiClient):
     """
     LMS API client with convenience methods for making API calls.
     """
-    @_retry_lms_api()
-    def learners_to_retire(self, states_to_request, cool_off_days=7, limit=None):
+    def learners_to_retire(self, states_to_request, cool_off_days=7, limit=None,
+                           page_size=None, max_concurrency=4):
         """
         Retrieves a list of learners awaiting retirement actions.
+
+        When page_size is given, the retirement queue is requested page by page
+        and a PaginatedResponse is returned instead of a list. Pages after the
+        first are prefetched concurrently while the caller iterates; use .all()
+        to collect every learner into a list.
         """
         params = {
             'cool_off_days': cool_off_days,
@@ -200,6 +327,22 @@ class LmsApi(BaseApiClient):
         }
         if limit:
             params['limit'] = limit
+        if page_size is None:
+            return self._retirement_queue_page(params)
+
+        def fetch_page(page):
+            """
+            Fetch a single page of the retirement queue.
+            """
+            return self._retirement_queue_page(dict(params, page=page, page_size=page_size))
+
+        return PaginatedResponse(fetch_page, page_size, max_concurrency)
+
+    @_retry_lms_api()
+    def _retirement_queue_page(self, params):
+        """
+        Issues one GET against the retirement queue endpoint with the usual retries.
+        """
         api_url = self.get_api_url('api/user/v1/accounts/retirement_queue')
         return self._request('GET', api_url, params=params)
 
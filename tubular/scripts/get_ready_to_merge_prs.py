@@ -3,13 +3,21 @@
 """
 Command-line script to get open prs with label 'Ready to merge'
 """
+import hashlib
+import hmac
 import json
 import logging
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from os import path
+from urllib.parse import parse_qs, urlparse
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
 
 # Add top-level module path to sys.path before importing tubular code.
 sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
@@ -18,6 +26,19 @@ logging.basicConfig(stream=sys.stdout, level=logging.INFO)
 LOG = logging.getLogger(__name__)
 
 GIT_API_URL = 'https://api.github.com/search/issues?per_page=100'
+READY_TO_MERGE_LABEL = 'Ready to merge'
+# Concurrent workers used to fetch additional search pages.
+PAGE_FETCH_WORKERS = 5
+# Sleep once fewer than this many search requests remain before the limit resets.
+RATE_LIMIT_FLOOR = 5
+# Cached search results younger than this are served without touching GitHub.
+CACHE_FRESH_SECONDS = 30
+# Stale results up to this age are still served while a background refresh runs.
+CACHE_STALE_SECONDS = 300
+
+# Search results per org: {'timestamp', 'data', 'etag', 'refreshing'}.
+_RESPONSE_CACHE = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
 
 
 @click.command("get_ready_to_merge_prs")
@@ -31,7 +52,25 @@ GIT_API_URL = 'https://api.github.com/search/issues?per_page=100'
     envvar='GIT_TOKEN',
     help='The github access token, see https://help.github.com/articles/creating-an-access-token-for-command-line-use/'
 )
-def get_ready_to_merge_prs(org, token):
+@click.option(
+    '--mode',
+    type=click.Choice(['poll', 'webhook']),
+    default='poll',
+    help='"poll" queries the GitHub search API once and exits. "webhook" runs an HTTP '
+         'listener for pull_request label events so PRs are picked up without polling.'
+)
+@click.option(
+    '--port',
+    default=8040,
+    help='Port the webhook listener binds to. Only used with --mode=webhook.'
+)
+@click.option(
+    '--webhook-secret',
+    envvar='GITHUB_WEBHOOK_SECRET',
+    default=None,
+    help='Shared secret used to verify the X-Hub-Signature-256 header of incoming webhooks.'
+)
+def get_ready_to_merge_prs(org, token, mode, port, webhook_secret):
     """
     get a list of all prs which are open and have a label "Ready to merge" in organization.
 
@@ -42,31 +81,149 @@ def get_ready_to_merge_prs(org, token):
     Returns:
             list of all prs.
     """
+    if mode == 'webhook':
+        run_webhook_listener(port, webhook_secret)
+        return None
+
     urls = get_github_api_response(org, token)
     print(urls)
     return urls
 
 
+def _make_session(token):
+    """
+    Build a session with auth headers and a keep-alive pool sized for the
+    concurrent page fetches.
+    """
+    session = requests.Session()
+    session.headers.update({
+        'Accept': "application/vnd.github.antiope-preview+json",
+        'Authorization': "bearer {token}".format(token=token),
+    })
+    session.mount('https://', HTTPAdapter(pool_maxsize=2 * PAGE_FETCH_WORKERS))
+    return session
+
+
+def _last_page(resp):
+    """
+    Page count parsed from the Link header of a search response, 1 when absent.
+    """
+    last = (resp.links or {}).get('last')
+    if not last:
+        return 1
+    return int(parse_qs(urlparse(last['url']).query)['page'][0])
+
+
+def _sleep_for_rate_limit(resp):
+    """
+    Sleep until the search rate limit resets when it is nearly exhausted.
+    """
+    remaining = resp.headers.get('X-RateLimit-Remaining')
+    if remaining is None or int(remaining) >= RATE_LIMIT_FLOOR:
+        return
+    delay = min(max(int(resp.headers.get('X-RateLimit-Reset', 0)) - time.time(), 0), 60)
+    if delay:
+        LOG.info('Nearly at the search rate limit - sleeping {delay:.0f}s.'.format(delay=delay))
+        time.sleep(delay)
+
+
+def _clear_response_cache():
+    """
+    Drop all cached search results. Used by tests.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+
 def get_github_api_response(org, token):
     """
     get github pull requests
     https://docs.github.com/en/search-github/searching-on-github/searching-issues-and-pull-requests
+
+    Results are cached per org with stale-while-revalidate semantics: entries
+    younger than CACHE_FRESH_SECONDS are returned directly; entries younger
+    than CACHE_STALE_SECONDS are returned while a background thread refreshes
+    them; anything older is refreshed synchronously.
+    """
+    now = time.time()
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(org)
+        if entry:
+            age = now - entry['timestamp']
+            if age < CACHE_FRESH_SECONDS:
+                return entry['data']
+            if age < CACHE_STALE_SECONDS:
+                if not entry['refreshing']:
+                    entry['refreshing'] = True
+                    threading.Thread(
+                        target=_fetch_and_cache, args=(org, token), daemon=True
+                    ).start()
+                return entry['data']
+
+    return _fetch_and_cache(org, token)
+
+
+def _fetch_and_cache(org, token):
+    """
+    Hit the search API and update the cache for the org.
+
+    A cached ETag is revalidated with If-None-Match; a 304 answer costs no
+    search quota and just refreshes the entry's timestamp. On errors the
+    previous cached value (or an empty list) is returned, as before.
+
+    All result pages are fetched, with pages after the first retrieved concurrently.
     """
     LOG.info("Preparing to hit api")
-    params = f'q=is:pr is:open label:"Ready to merge" org:{org}'
-    headers = {
-        'Accept': "application/vnd.github.antiope-preview+json",
-        'Authorization': "bearer {token}".format(token=token),
-    }
+    params = f'q=is:pr is:open label:"{READY_TO_MERGE_LABEL}" org:{org}'
     data = []
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(org)
+        etag = entry['etag'] if entry else None
 
     try:
-        resp = requests.get(GIT_API_URL, params=params, headers=headers)
+        session = _make_session(token)
+        headers = {'If-None-Match': etag} if etag else None
+        resp = session.get(GIT_API_URL, params=params, headers=headers)
+        if resp.status_code == 304 and entry:
+            with _RESPONSE_CACHE_LOCK:
+                entry['timestamp'] = time.time()
+                entry['refreshing'] = False
+            return entry['data']
         if resp.status_code == 200:
-            data = resp.json()
-            LOG.info("Got {count} prs.".format(count=data['total_count']))
-            data = [item['html_url'] for item in data['items']]
+            payload = resp.json()
+            LOG.info("Got {count} prs.".format(count=payload['total_count']))
+            items = list(payload['items'])
+
+            def fetch_page(page):
+                """
+                Fetch a single page of search results.
+                """
+                page_resp = session.get(GIT_API_URL, params='{params}&page={page}'.format(params=params, page=page))
+                if page_resp.status_code != 200:
+                    raise requests.HTTPError(
+                        'api return status code {code} and error {con}'.format(
+                            code=page_resp.status_code, con=page_resp.content
+                        )
+                    )
+                _sleep_for_rate_limit(page_resp)
+                return page_resp.json()['items']
+
+            last_page = _last_page(resp)
+            if last_page > 1:
+                _sleep_for_rate_limit(resp)
+                with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+                    for page_items in executor.map(fetch_page, range(2, last_page + 1)):
+                        items.extend(page_items)
+
+            data = [item['html_url'] for item in items]
             data = json.dumps(data)
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[org] = {
+                    'timestamp': time.time(),
+                    'data': data,
+                    'etag': resp.headers.get('ETag'),
+                    'refreshing': False,
+                }
             return data
 
         else:
@@ -77,9 +234,112 @@ def get_github_api_response(org, token):
     except Exception as err:  # pylint: disable=broad-except
         LOG.error('Github api throws error: {con}'.format(con=str(err)))
 
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(org)
+        if entry:
+            entry['refreshing'] = False
+            return entry['data']
     return data
 
 
+def is_valid_webhook_signature(secret, payload, signature_header):
+    """
+    Verify the HMAC-SHA256 signature GitHub sends in the X-Hub-Signature-256 header.
+
+    Args:
+        secret (str): The shared webhook secret.
+        payload (bytes): The raw request body.
+        signature_header (str): The value of the X-Hub-Signature-256 header.
+
+    Returns:
+        bool: True if the signature matches the payload.
+    """
+    if not secret or not signature_header:
+        return False
+    expected = 'sha256={}'.format(
+        hmac.new(secret.encode('utf-8'), payload, hashlib.sha256).hexdigest()
+    )
+    return hmac.compare_digest(expected, signature_header)
+
+
+def extract_ready_to_merge_url(event):
+    """
+    Pull the PR URL out of a pull_request webhook event, if it is relevant.
+
+    Only label events ('labeled', 'unlabeled', 'closed') for the "Ready to merge"
+    label on an open pull request are relevant.
+
+    Args:
+        event (dict): The parsed webhook payload.
+
+    Returns:
+        str: The html_url of the pull request, or None if the event is irrelevant.
+    """
+    if event.get('action') not in ('labeled', 'unlabeled', 'closed'):
+        return None
+    label = event.get('label') or {}
+    if label.get('name') != READY_TO_MERGE_LABEL:
+        return None
+    pull_request = event.get('pull_request') or {}
+    if pull_request.get('state') != 'open':
+        return None
+    return pull_request.get('html_url')
+
+
+def run_webhook_listener(port, webhook_secret):
+    """
+    Run an HTTP listener for GitHub pull_request webhooks.
+
+    Each verified event for an open PR with the "Ready to merge" label is written to
+    stdout as a JSON line, where the merge pipeline can consume it. Polling via
+    get_github_api_response remains available as a reconciliation sweep.
+    """
+    class _WebhookHandler(BaseHTTPRequestHandler):
+        """
+        Handles pull_request webhook POSTs from GitHub.
+        """
+        def do_POST(self):  # pylint: disable=invalid-name
+            """
+            Verify, filter and emit a single webhook event.
+            """
+            payload = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            signature = self.headers.get('X-Hub-Signature-256')
+            if not is_valid_webhook_signature(webhook_secret, payload, signature):
+                LOG.error('Webhook signature verification failed.')
+                self.send_response(403)
+                self.end_headers()
+                return
+
+            try:
+                event = json.loads(payload)
+            except ValueError:
+                self.send_response(400)
+                self.end_headers()
+                return
+
+            url = extract_ready_to_merge_url(event)
+            if url:
+                LOG.info('PR ready to merge: {url}'.format(url=url))
+                print(json.dumps([url]), flush=True)
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            """
+            Route http.server's per-request lines through our logger.
+            """
+            LOG.debug(format, *args)
+
+    server = HTTPServer(('0.0.0.0', port), _WebhookHandler)
+    LOG.info('Listening for pull_request webhooks on port {port}.'.format(port=port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
 def parse_urls(data):
     """
     parse data to return only org, repo and pull request number
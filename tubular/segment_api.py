@@ -4,15 +4,21 @@ Segment API call wrappers
 import logging
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 import backoff
 import requests
+from requests.adapters import HTTPAdapter
 from simplejson.errors import JSONDecodeError
 from six import text_type
 
 # Maximum number of tries on Segment API calls
 MAX_TRIES = 4
 
+# Maximum number of regulation requests POSTed to Segment at once when a batch
+# spans several chunks.
+MAX_CONCURRENT_REGULATION_REQUESTS = 4
+
 # These are the required/optional keys in the learner dict that contain IDs we need to retire from Segment.
 REQUIRED_IDENTIFYING_KEYS = [('user', 'id'), 'original_username']
 OPTIONAL_IDENTIFYING_KEYS = ['ecommerce_segment_id']
@@ -29,6 +35,12 @@ MAXIMUM_USERS_IN_REGULATION_REQUEST = 5000
 
 LOG = logging.getLogger(__name__)
 
+# Shared session so the regulation calls reuse one keep-alive TLS connection
+# per pooled socket instead of paying a handshake on every request. The pool
+# is sized for the concurrent chunk submissions.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=2 * MAX_CONCURRENT_REGULATION_REQUESTS))
+
 
 def _backoff_handler(details):
     """
@@ -108,7 +120,7 @@ class SegmentApi:
             "Authorization": "Bearer {}".format(self.auth_token),
             "Content-Type": "application/json"
         }
-        resp = requests.post(self.base_url + url, json=params, headers=headers)
+        resp = _SESSION.post(self.base_url + url, json=params, headers=headers)
         resp.raise_for_status()
         return resp
 
@@ -123,7 +135,7 @@ class SegmentApi:
         headers = {
             "Authorization": "Bearer {}".format(self.auth_token)
         }
-        resp = requests.get(self.base_url + url, headers=headers)
+        resp = _SESSION.get(self.base_url + url, headers=headers)
         resp.raise_for_status()
         return resp
 
@@ -169,6 +181,28 @@ class SegmentApi:
 
             raise Exception(err)
 
+    def _send_regulation_requests(self, params_list):
+        """
+        Send the prepared regulation requests, concurrently when the batch
+        spans several chunks.
+
+        The chunks are independent of each other, so they are POSTed from a
+        thread pool and the call is I/O bound on the slowest chunk instead of
+        the sum of all of them. Each request keeps the usual per-call
+        retry/backoff behavior; the first failure is re-raised once every
+        request has finished.
+        """
+        if len(params_list) <= 1:
+            for params in params_list:
+                self._send_regulation_request(params)
+            return
+
+        max_workers = min(MAX_CONCURRENT_REGULATION_REQUESTS, len(params_list))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._send_regulation_request, params) for params in params_list]
+            for future in futures:
+                future.result()
+
     def delete_and_suppress_learner(self, learner):
         """
         Delete AND suppress a single Segment user using the bulk user deletion REST API.
@@ -187,6 +221,7 @@ class SegmentApi:
         :param chunk_size: How many learners should be retired in this batch.
         :param beginning_idx: Index into learners where this batch should start.
         """
+        params_list = []
         curr_idx = beginning_idx
         while curr_idx < len(learners):
             start_idx = curr_idx
@@ -209,20 +244,20 @@ class SegmentApi:
                     'Attempting to UNSUPPRESS too many user values (%s) at once in bulk request - decrease chunk_size.',
                     len(learner_vals)
                 )
-                return
+                break
 
-            params = {
+            params_list.append({
                 "regulation_type": "Unsuppress",
                 "attributes": {
                     "name": "userId",
                     "values": learner_vals
                 }
-            }
-
-            self._send_regulation_request(params)
+            })
 
             curr_idx += chunk_size
 
+        self._send_regulation_requests(params_list)
+
     def delete_and_suppress_learners(self, learners, chunk_size, beginning_idx=0):
         """
         Sets up the Segment REST API calls to GDPR-delete users in chunks.
@@ -231,6 +266,7 @@ class SegmentApi:
         :param chunk_size: How many learners should be retired in this batch.
         :param beginning_idx: Index into learners where this batch should start.
         """
+        params_list = []
         curr_idx = beginning_idx
         while curr_idx < len(learners):
             start_idx = curr_idx
@@ -255,20 +291,20 @@ class SegmentApi:
                     'Attempting to delete too many user values (%s) at once in bulk request - decrease chunk_size.',
                     len(learner_vals)
                 )
-                return
+                break
 
-            params = {
+            params_list.append({
                 "regulation_type": "Suppress_With_Delete",
                 "attributes": {
                     "name": "userId",
                     "values": learner_vals
                 }
-            }
-
-            self._send_regulation_request(params)
+            })
 
             curr_idx += chunk_size
 
+        self._send_regulation_requests(params_list)
+
     def get_bulk_delete_status(self, bulk_delete_id):
         """
         Queries the status of a previously submitted bulk delete request.
@@ -3,6 +3,8 @@ Tests of the code interacting with the Asgard API.
 """
 
 import os
+import threading
+import time
 import unittest
 import itertools
 import boto3
@@ -380,6 +382,11 @@ class TestAsgard(unittest.TestCase):
     """
     _multiprocess_can_split_ = True
 
+    def setUp(self):
+        super().setUp()
+        # Each test mocks its own cluster list - don't let one leak into the next.
+        asgard._invalidate_cluster_list_cache()  # pylint: disable=protected-access
+
     def test_bad_clusters_endpoint(self, _req_mock):
         relevant_asgs = []
         self.assertRaises(requests_mock.NoMockAddress, asgard.clusters_for_asgs, relevant_asgs)
@@ -945,7 +952,9 @@ class TestAsgard(unittest.TestCase):
             asgard.deploy(ami_id)
         except BackendError:
             pass
-        self.assertEqual(1, counter)  # We fail midway here, so we dont expect additional calls to new_asg
+        # ASG creation is concurrent across clusters, so the failure doesn't stop the
+        # other cluster's creation - but no cluster should see more than one attempt.
+        self.assertEqual(2, counter)
 
     @mock_autoscaling
     @mock_ec2
@@ -1859,3 +1868,48 @@ class TestAsgard(unittest.TestCase):
             'minSize': 2,
         }
         assert asgard._asg_is_empty(asg) is False
+
+
+class TestSingleFlight(unittest.TestCase):
+    """
+    Tests for the helper that coalesces identical in-flight requests.
+    """
+    def test_concurrent_calls_share_one_execution(self):
+        single_flight = asgard._SingleFlight()  # pylint: disable=protected-access
+        entered = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_call():
+            calls.append(1)
+            entered.set()
+            release.wait(5)
+            return "result"
+
+        results = []
+        workers = [
+            threading.Thread(target=lambda: results.append(single_flight.do("key", slow_call)))
+            for _ in range(2)
+        ]
+        workers[0].start()
+        entered.wait(5)
+        workers[1].start()
+        # Give the second worker a moment to join the in-flight call.
+        time.sleep(0.1)
+        release.set()
+        for worker in workers:
+            worker.join(5)
+
+        self.assertEqual(["result", "result"], results)
+        self.assertEqual(1, len(calls))
+
+    def test_errors_propagate_to_all_callers(self):
+        single_flight = asgard._SingleFlight()  # pylint: disable=protected-access
+
+        def failing_call():
+            raise asgard.BackendError("boom")
+
+        with self.assertRaises(asgard.BackendError):
+            single_flight.do("key", failing_call)
+        # The key is released again after the failure.
+        self.assertEqual("ok", single_flight.do("key", lambda: "ok"))
@@ -558,3 +558,30 @@ class TestLicenseManagerApi(OAuth2Mixin, unittest.TestCase):
                 original_username=FAKE_ORIGINAL_USERNAME
             )
         )
+
+
+class TestPaginatedResponse(unittest.TestCase):
+    """
+    Test the prefetching page iterator used by LmsApi.learners_to_retire.
+    """
+    def test_yields_items_across_pages_in_order(self):
+        pages = {
+            1: [1, 2],
+            2: [3, 4],
+            3: [5],
+        }
+        paginated = edx_api.PaginatedResponse(pages.get, page_size=2, max_concurrency=2)
+        self.assertEqual([1, 2, 3, 4, 5], list(paginated))
+
+    def test_all_collects_every_item(self):
+        pages = {1: ['a', 'b'], 2: []}
+        paginated = edx_api.PaginatedResponse(pages.get, page_size=2, max_concurrency=2)
+        self.assertEqual(['a', 'b'], paginated.all())
+
+    def test_fetch_errors_are_raised_to_the_consumer(self):
+        def fetch_page(page):
+            raise HTTPError('retirement queue unavailable')
+
+        paginated = edx_api.PaginatedResponse(fetch_page, page_size=2, max_concurrency=2)
+        with self.assertRaises(HTTPError):
+            paginated.all()
@@ -1,11 +1,18 @@
 """
 Tests of the code to get open prs with label 'Ready to merge'
 """
+import hashlib
+import hmac
 import json
 import unittest
 from unittest import mock
 
-from tubular.scripts.get_ready_to_merge_prs import get_github_api_response
+from tubular.scripts import get_ready_to_merge_prs
+from tubular.scripts.get_ready_to_merge_prs import (
+    extract_ready_to_merge_url,
+    get_github_api_response,
+    is_valid_webhook_signature,
+)
 
 
 class TestReadyToMergePRS(unittest.TestCase):
@@ -14,6 +21,7 @@ class TestReadyToMergePRS(unittest.TestCase):
     """
     def setUp(self):
         super().setUp()
+        get_ready_to_merge_prs._clear_response_cache()  # pylint: disable=protected-access
         self.content = {
             "total_count": 1,
             "incomplete_results": "false",
@@ -34,7 +42,7 @@ class TestReadyToMergePRS(unittest.TestCase):
                 }]
         }
 
-    def _mock_response(self, status=200, json_data=None, raise_for_status=None):
+    def _mock_response(self, status=200, json_data=None, raise_for_status=None, links=None):
         """
         mock the response.
         """
@@ -46,9 +54,11 @@ class TestReadyToMergePRS(unittest.TestCase):
         mock_resp.status_code = status
 
         mock_resp.json = mock.Mock(return_value=json_data)
+        mock_resp.links = links or {}
+        mock_resp.headers = {}
         return mock_resp
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_apis(self, mock_get):
         """ verify method returns the valid pr links """
         mock_resp = self._mock_response(json_data=self.content)
@@ -57,7 +67,7 @@ class TestReadyToMergePRS(unittest.TestCase):
         expected = [item['html_url'] for item in self.content['items']]
         self.assertEqual(json.dumps(expected), content)
 
-    @mock.patch('requests.get')
+    @mock.patch('requests.Session.get')
     def test_apis_without_records(self, mock_get):
         """ verify code works in case of no results """
         mock_resp = self._mock_response(json_data={'total_count': 0, 'incomplete_results': False, 'items': []})
@@ -67,5 +77,111 @@ class TestReadyToMergePRS(unittest.TestCase):
 
     def test_apis_with_errors(self):
         """ test in case of exception"""
-        with mock.patch('tubular.scripts.get_ready_to_merge_prs.requests.get', side_effect=Exception("error")):
+        with mock.patch('requests.Session.get', side_effect=Exception("error")):
             get_github_api_response('openedx', '12345')
+
+    @mock.patch('requests.Session.get')
+    def test_apis_paginated(self, mock_get):
+        """ verify results from all search pages are merged """
+        first_page = {
+            'total_count': 3,
+            'incomplete_results': 'false',
+            'items': self.content['items'],
+        }
+        second_page = {
+            'total_count': 3,
+            'incomplete_results': 'false',
+            'items': [{'html_url': 'https://github.com/openedx/edx-ora2/pull/900'}],
+        }
+        mock_get.side_effect = [
+            self._mock_response(
+                json_data=first_page,
+                links={'last': {'url': 'https://api.github.com/search/issues?per_page=100&page=2'}},
+            ),
+            self._mock_response(json_data=second_page),
+        ]
+        content = get_github_api_response('openedx', '12345')
+        expected = [item['html_url'] for item in first_page['items'] + second_page['items']]
+        self.assertEqual(json.dumps(expected), content)
+
+    @mock.patch('requests.Session.get')
+    def test_apis_fresh_cache_hit(self, mock_get):
+        """ verify a repeat call within the fresh window skips the API """
+        mock_get.return_value = self._mock_response(json_data=self.content)
+        first = get_github_api_response('openedx', '12345')
+        second = get_github_api_response('openedx', '12345')
+        self.assertEqual(first, second)
+        self.assertEqual(1, mock_get.call_count)
+
+    @mock.patch('requests.Session.get')
+    def test_apis_etag_revalidation(self, mock_get):
+        """ verify a 304 answer serves the cached result """
+        mock_get.side_effect = [
+            self._mock_response(json_data=self.content),
+            self._mock_response(status=304),
+        ]
+        first = get_github_api_response('openedx', '12345')
+        # Age the entry past the stale window to force a synchronous refresh.
+        with get_ready_to_merge_prs._RESPONSE_CACHE_LOCK:  # pylint: disable=protected-access
+            get_ready_to_merge_prs._RESPONSE_CACHE['openedx']['timestamp'] = 0  # pylint: disable=protected-access
+        second = get_github_api_response('openedx', '12345')
+        self.assertEqual(first, second)
+        self.assertEqual(2, mock_get.call_count)
+
+
+class TestReadyToMergeWebhook(unittest.TestCase):
+    """
+    Tests cases for the pull_request webhook helpers.
+    """
+    def _make_event(self, action='labeled', label='Ready to merge', state='open'):
+        """
+        Build a minimal pull_request webhook payload.
+        """
+        return {
+            'action': action,
+            'label': {'name': label},
+            'pull_request': {
+                'state': state,
+                'html_url': 'https://github.com/openedx/edx-platform/pull/300001',
+            },
+        }
+
+    def test_valid_signature(self):
+        """ verify a correctly signed payload passes """
+        payload = b'{"action": "labeled"}'
+        signature = 'sha256={}'.format(
+            hmac.new(b'secret', payload, hashlib.sha256).hexdigest()
+        )
+        self.assertTrue(is_valid_webhook_signature('secret', payload, signature))
+
+    def test_invalid_signature(self):
+        """ verify a payload signed with the wrong secret fails """
+        payload = b'{"action": "labeled"}'
+        signature = 'sha256={}'.format(
+            hmac.new(b'wrong-secret', payload, hashlib.sha256).hexdigest()
+        )
+        self.assertFalse(is_valid_webhook_signature('secret', payload, signature))
+
+    def test_missing_signature_or_secret(self):
+        """ verify missing secrets/signatures never pass """
+        self.assertFalse(is_valid_webhook_signature('secret', b'{}', None))
+        self.assertFalse(is_valid_webhook_signature(None, b'{}', 'sha256=abc'))
+
+    def test_extracts_url_for_labeled_open_pr(self):
+        """ verify the PR url is returned for a relevant label event """
+        self.assertEqual(
+            extract_ready_to_merge_url(self._make_event()),
+            'https://github.com/openedx/edx-platform/pull/300001'
+        )
+
+    def test_ignores_other_labels(self):
+        """ verify events for unrelated labels are skipped """
+        self.assertIsNone(extract_ready_to_merge_url(self._make_event(label='needs triage')))
+
+    def test_ignores_other_actions(self):
+        """ verify non-label actions are skipped """
+        self.assertIsNone(extract_ready_to_merge_url(self._make_event(action='synchronize')))
+
+    def test_ignores_closed_prs(self):
+        """ verify label events on closed PRs are skipped """
+        self.assertIsNone(extract_ready_to_merge_url(self._make_event(state='closed')))
@@ -58,7 +58,7 @@ def setup_regulation_api():
     """
     Fixture to setup common bulk delete items.
     """
-    with mock.patch('requests.post') as mock_post:
+    with mock.patch('requests.Session.post') as mock_post:
         segment = SegmentApi(
             *[TEST_SEGMENT_CONFIG[key] for key in [
                 'fake_base_url', 'fake_auth_token', 'fake_workspace'
@@ -167,3 +167,16 @@ def test_bulk_unsuppress_error(setup_regulation_api, caplog):  # pylint: disable
     assert "ecommerce-90" not in caplog.text
     assert "Unsuppress" in caplog.text
     assert "Test error message" in caplog.text
+
+
+def test_bulk_delete_multiple_chunks(setup_regulation_api):  # pylint: disable=redefined-outer-name
+    """
+    Test that a batch spanning several chunks sends one request per chunk
+    """
+    mock_post, segment = setup_regulation_api
+    mock_post.return_value = FakeResponse()
+
+    learners = [get_fake_user_retirement() for _ in range(3)]
+    segment.delete_and_suppress_learners(learners, 1)
+
+    assert mock_post.call_count == 3